@@ -0,0 +1,106 @@
+import threading
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+
+
+class CoauthorNetwork:
+    """Co-authorship graph backed by a sparse paper x author incidence matrix.
+
+    The incidence matrix is built once from the "Authors" column. Each filter
+    selection only slices its rows and runs one sparse product to get the
+    co-author edge weights. Node positions are cached across selections, so a
+    new selection only lays out the authors that have not been placed yet.
+    """
+
+    def __init__(self, df, author_column='Authors', college_column='College', separator=';', layout_iterations=10, seed=42):
+        self.df_index = df.index
+        self.layout_iterations = layout_iterations
+        self.seed = seed
+
+        author_lists = df[author_column].fillna('').astype(str).str.split(separator)
+        exploded = author_lists.explode().str.strip()
+        exploded = exploded[exploded != '']
+
+        paper_rows = self.df_index.get_indexer(exploded.index)
+        author_codes, self.authors = pd.factorize(exploded.values)
+        self.incidence = sp.csr_matrix(
+            (np.ones(len(author_codes), dtype=np.float32), (paper_rows, author_codes)),
+            shape=(len(df), len(self.authors))
+        )
+        # Duplicate names within one paper would otherwise count twice.
+        self.incidence.data[:] = 1.0
+
+        college_codes, self.colleges = pd.factorize(df[college_column].fillna('Unknown').astype(str))
+        college_incidence = sp.csr_matrix(
+            (np.ones(len(df), dtype=np.float32), (np.arange(len(df)), college_codes)),
+            shape=(len(df), len(self.colleges))
+        )
+        author_college_counts = (self.incidence.T @ college_incidence).toarray()
+        self.author_colleges = np.asarray(self.colleges)[author_college_counts.argmax(axis=1)]
+
+        self.positions = np.zeros((len(self.authors), 2))
+        self.placed = np.zeros(len(self.authors), dtype=bool)
+        self._layout_lock = threading.Lock()
+
+    def get_rows(self, filtered_df):
+        """Positional rows of the incidence matrix for a filtered DataFrame."""
+        rows = self.df_index.get_indexer(filtered_df.index)
+        return rows[rows >= 0]
+
+    def get_graph(self, rows):
+        """Return active author ids, their paper counts and the weighted co-author matrix."""
+        incidence = self.incidence[rows]
+        coauthorship = (incidence.T @ incidence).tocsr()
+        paper_counts = coauthorship.diagonal()
+        active = np.flatnonzero(paper_counts)
+        coauthorship = coauthorship[active][:, active]
+        coauthorship.setdiag(0)
+        coauthorship.eliminate_zeros()
+        return active, paper_counts[active], coauthorship
+
+    def get_edges(self, coauthorship, max_edges=None):
+        """Upper-triangle edges (i, j, weight), heaviest first when capped."""
+        edges = sp.triu(coauthorship, k=1).tocoo()
+        if max_edges is not None and edges.nnz > max_edges:
+            keep = np.argpartition(edges.data, -max_edges)[-max_edges:]
+            return edges.row[keep], edges.col[keep], edges.data[keep]
+        return edges.row, edges.col, edges.data
+
+    def _seed_positions(self, author_ids):
+        """Deterministic start positions: a jittered disc around each college's anchor."""
+        college_codes = pd.Index(self.colleges).get_indexer(self.author_colleges[author_ids])
+        angles = 2 * np.pi * college_codes / max(len(self.colleges), 1)
+        anchors = np.column_stack([np.cos(angles), np.sin(angles)]) * 10
+
+        rng = np.random.default_rng(self.seed)
+        all_offsets = rng.normal(scale=2.0, size=(len(self.authors), 2))
+        return anchors + all_offsets[author_ids]
+
+    def update_layout(self, active, coauthorship):
+        """Place authors in ``active`` that have no cached position yet.
+
+        Already placed authors stay fixed. New authors start from their college
+        anchor and are pulled towards their co-authors with a few rounds of
+        sparse neighbour averaging, which keeps the cost linear in the edges.
+        """
+        with self._layout_lock:
+            new = ~self.placed[active]
+            if new.any():
+                seeds = self._seed_positions(active[new])
+                adjacency = coauthorship[new]
+                degree = np.asarray(adjacency.sum(axis=1)).ravel()
+                has_neighbours = degree > 0
+
+                local = self.positions[active].copy()
+                local[new] = seeds
+                for _ in range(self.layout_iterations):
+                    neighbour_mean = (adjacency @ local)[has_neighbours] / degree[has_neighbours, None]
+                    updated = seeds.copy()
+                    updated[has_neighbours] = 0.5 * seeds[has_neighbours] + 0.5 * neighbour_mean
+                    local[new] = updated
+
+                self.positions[active[new]] = local[new]
+                self.placed[active[new]] = True
+            return self.positions[active].copy()
@@ -4,3 +4,16 @@ class Config:
     SECRET_KEY = 'your-secret-key'
     DEBUG = True
     # Add other configuration variables here
+
+    # Cache warm-up: precompute the default view and these common selections
+    # in a background thread when the dashboard starts. Each selection may set
+    # 'colleges', 'status' and/or 'years'; missing keys use the default view.
+    CACHE_MAX_ENTRIES = 256
+    WARMUP_ENABLED = True
+    WARMUP_SINGLE_COLLEGES = True
+    WARMUP_SELECTIONS = [
+        {'status': ['PUBLISHED']},
+    ]
+
+    # Co-authorship network: cap on edges drawn per view (heaviest kept).
+    NETWORK_MAX_EDGES = 20000
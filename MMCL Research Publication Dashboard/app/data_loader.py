@@ -1,12 +1,15 @@
 import pandas as pd
+from app.cache import LRUCache, make_filter_key
 
 class DataLoader:
-    def __init__(self, file_path):
+    def __init__(self, file_path, cache_size=256):
         self.file_path = file_path
         self.df = None
+        self.filtered_cache = LRUCache(cache_size)
 
     def connect(self):
         self.df = pd.read_csv(self.file_path)
+        self.filtered_cache.clear()
     
     def get_all_data(self):
         return self.df
@@ -49,11 +52,15 @@ class DataLoader:
     
     def get_filtered_data(self, selected_colleges, selected_status, selected_years):
         if self.df is not None:
-            filtered_df = self.df[
-                (self.df['College'].isin(selected_colleges)) & 
-                (self.df['PUBLISHED'].isin(selected_status)) & 
-                (self.df['Year'].between(selected_years[0], selected_years[1]))
-            ]
+            key = make_filter_key(selected_colleges, selected_status, selected_years)
+            filtered_df = self.filtered_cache.get(key)
+            if filtered_df is None:
+                filtered_df = self.df[
+                    (self.df['College'].isin(selected_colleges)) & 
+                    (self.df['PUBLISHED'].isin(selected_status)) & 
+                    (self.df['Year'].between(selected_years[0], selected_years[1]))
+                ]
+                self.filtered_cache.set(key, filtered_df)
             return filtered_df
         else:
             raise ValueError("Data not loaded. Please call 'connect()' first.")
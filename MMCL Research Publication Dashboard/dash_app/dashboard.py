@@ -1,10 +1,16 @@
 import dash
+import functools
+import threading
+import time
 from dash.dependencies import Input, Output, State
+from app.cache import LRUCache, make_filter_key
+from app.coauthor_network import CoauthorNetwork
 from app.data_loader import DataLoader
 from dash import Dash, dcc, html
 import plotly.express as px
 import dash_bootstrap_components as dbc
 import dash_ag_grid as dag
+import numpy as np
 import pandas as pd
 from collections import Counter
 import plotly.graph_objects as go
@@ -14,8 +20,14 @@ class DashApp:
     def __init__(self, server):
         self.server = server
         self.app = Dash(__name__, server=server, routes_pathname_prefix='/dash/', external_stylesheets=[dbc.themes.BOOTSTRAP])
-        self.data_loader = DataLoader('app/data/AcadResearchDatasetWithCountry.csv')
+        cache_size = server.config.get('CACHE_MAX_ENTRIES', 256)
+        self.data_loader = DataLoader('app/data/AcadResearchDatasetWithCountry.csv', cache_size=cache_size)
         self.data_loader.connect()
+        self.figure_cache = LRUCache(cache_size)
+        self.coauthor_network = CoauthorNetwork(self.data_loader.get_all_data())
+        self.network_max_edges = server.config.get('NETWORK_MAX_EDGES', 20000)
+        self.warmup_thread = None
+        self.warmup_seconds = None
         self.PLOTLY_LOGO = "https://i.imghippo.com/files/8hU5H1724158029.png"
         self.palette_dict = {
             'MITL': 'red',
@@ -37,6 +49,9 @@ class DashApp:
         self.setup_layout()
         self.register_callbacks()
 
+        if server.config.get('WARMUP_ENABLED', True):
+            self.start_warmup()
+
     def get_total_counts(self):
         count = len(self.data_loader.get_unique_values('Title'))
         return str(count)
@@ -228,6 +243,9 @@ class DashApp:
                 )
                 
             ], style={"marginTop": "20px"}),
+            dbc.Row([
+                dbc.Col(dcc.Graph(id='coauthor_network_chart'), width=12, style={"height": "600px", "overflow": "hidden"})
+            ], style={"marginTop": "20px"}),
         ])
 
         tab1 = dbc.Tab(main_dash, label="Overview")
@@ -424,6 +442,64 @@ class DashApp:
 
         return fig_bar
     
+    def update_coauthor_network_chart(self, selected_colleges, selected_status, selected_years):
+        df = self.data_loader.get_filtered_data(selected_colleges, selected_status, selected_years)
+
+        if df.empty:
+            return px.scatter(title='No Author Data Available')
+
+        network = self.coauthor_network
+        active, paper_counts, coauthorship = network.get_graph(network.get_rows(df))
+        positions = network.update_layout(active, coauthorship)
+        rows, cols, weights = network.get_edges(coauthorship, self.network_max_edges)
+
+        edge_x = np.column_stack([positions[rows, 0], positions[cols, 0], np.full(len(rows), np.nan)]).ravel()
+        edge_y = np.column_stack([positions[rows, 1], positions[cols, 1], np.full(len(rows), np.nan)]).ravel()
+
+        fig = go.Figure()
+        fig.add_trace(go.Scattergl(
+            x=edge_x,
+            y=edge_y,
+            mode='lines',
+            line=dict(width=0.5, color='#bbbbbb'),
+            hoverinfo='skip',
+            showlegend=False
+        ))
+
+        coauthor_counts = np.diff(coauthorship.indptr)
+        node_colleges = network.author_colleges[active]
+        for college in np.unique(node_colleges):
+            mask = node_colleges == college
+            fig.add_trace(go.Scattergl(
+                x=positions[mask, 0],
+                y=positions[mask, 1],
+                mode='markers',
+                name=college,
+                marker=dict(
+                    size=np.clip(4 + 2 * np.sqrt(paper_counts[mask]), 4, 20),
+                    color=self.palette_dict.get(college, 'grey'),
+                    line=dict(width=0.5, color='white')
+                ),
+                text=[
+                    f"{author}<br>{college}<br>Papers: {int(papers)}<br>Co-authors: {coauthors}"
+                    for author, papers, coauthors in zip(
+                        network.authors[active[mask]], paper_counts[mask], coauthor_counts[mask]
+                    )
+                ],
+                hoverinfo='text'
+            ))
+
+        fig.update_layout(
+            title=f'Co-authorship Network ({len(active)} authors, {coauthorship.nnz // 2} collaborations)',
+            xaxis=dict(visible=False),
+            yaxis=dict(visible=False, scaleanchor='x'),
+            template='plotly_white',
+            margin=dict(l=0, r=0, t=30, b=0),
+            height=600
+        )
+
+        return fig
+
     def process_sdgs(self, sdgs):
         """Process SDGs by splitting and stripping whitespace."""
         return [sdg.strip() for sdg in sdgs.split(';')]
@@ -524,7 +600,7 @@ class DashApp:
             [Input('college', 'value'),
              Input('status', 'value'),
              Input('years', 'value')]
-        )(self.update_world_map)
+        )(self.cached(self.update_world_map))
 
         self.app.callback(
             Output('college_line_plot', 'figure'),
@@ -533,7 +609,7 @@ class DashApp:
                 Input('status', 'value'),
                 Input('years', 'value')
             ]
-        )(self.update_line_plot)
+        )(self.cached(self.update_line_plot))
 
         self.app.callback(
             Output('college_pie_chart', 'figure'),
@@ -542,7 +618,7 @@ class DashApp:
                 Input('status', 'value'),
                 Input('years', 'value')
             ]
-        )(self.update_pie_chart)
+        )(self.cached(self.update_pie_chart))
 
         self.app.callback(
             Output('scopus_bar_plot', 'figure'),
@@ -551,14 +627,14 @@ class DashApp:
                 Input('status', 'value'),
                 Input('years', 'value')
             ]
-        )(self.update_scopus_bar_plot)
+        )(self.cached(self.update_scopus_bar_plot))
 
         self.app.callback(
             Output('publication_format_bar_plot', 'figure'),
             [Input('college', 'value'), 
              Input('status', 'value'), 
              Input('years', 'value')]
-        )(self.update_publication_format_bar_plot)
+        )(self.cached(self.update_publication_format_bar_plot))
 
         self.app.callback(
             Output('grid', 'rowData'),
@@ -567,7 +643,7 @@ class DashApp:
                 Input('status', 'value'),
                 Input('years', 'value')
             ]
-        )(self.update_grid)
+        )(self.cached(self.update_grid))
         self.app.callback(
             Output('author_contribution_chart', 'figure'),
             [
@@ -575,7 +651,16 @@ class DashApp:
                 Input('status', 'value'),
                 Input('years', 'value')
             ]
-        )(self.update_author_contribution_chart)
+        )(self.cached(self.update_author_contribution_chart))
+
+        self.app.callback(
+            Output('coauthor_network_chart', 'figure'),
+            [
+                Input('college', 'value'),
+                Input('status', 'value'),
+                Input('years', 'value')
+            ]
+        )(self.cached(self.update_coauthor_network_chart))
 
         self.app.callback(
             Output('sdg_bar_chart', 'figure'),
@@ -584,7 +669,7 @@ class DashApp:
                 Input('status', 'value'),
                 Input('years', 'value')
             ]
-        )(self.update_sdg_chart)
+        )(self.cached(self.update_sdg_chart))
 
         self.app.callback(
             Output('research_status_chart', 'figure'),
@@ -593,13 +678,82 @@ class DashApp:
                 Input('status', 'value'),
                 Input('years', 'value')
             ]
-        )(self.update_research_status_chart)
+        )(self.cached(self.update_research_status_chart))
 
 
     def update_grid(self, selected_colleges, selected_status, selected_years):
         df = self.data_loader.get_filtered_data(selected_colleges, selected_status, selected_years)
         return df.to_dict("records")
 
+    def get_filter_views(self):
+        """Callbacks driven by the College/status/year filters, in layout order."""
+        return [
+            self.update_world_map,
+            self.update_line_plot,
+            self.update_pie_chart,
+            self.update_scopus_bar_plot,
+            self.update_publication_format_bar_plot,
+            self.update_grid,
+            self.update_author_contribution_chart,
+            self.update_coauthor_network_chart,
+            self.update_sdg_chart,
+            self.update_research_status_chart,
+        ]
+
+    def cached(self, update_func):
+        """Wrap a filter callback so its output is memoized per filter selection."""
+        name = update_func.__name__
+
+        @functools.wraps(update_func)
+        def wrapper(selected_colleges, selected_status, selected_years):
+            key = (name,) + make_filter_key(selected_colleges, selected_status, selected_years)
+            result = self.figure_cache.get(key)
+            if result is None:
+                result = update_func(selected_colleges, selected_status, selected_years)
+                self.figure_cache.set(key, result)
+            return result
+
+        return wrapper
+
+    def get_warmup_selections(self):
+        """Default view followed by the common selections listed in the config."""
+        colleges = list(self.data_loader.get_unique_values('College'))
+        default = {
+            'colleges': colleges,
+            'status': list(self.data_loader.get_unique_values('PUBLISHED')),
+            'years': [self.data_loader.get_min_value('Year'), self.data_loader.get_max_value('Year')],
+        }
+
+        selections = [default]
+        if self.server.config.get('WARMUP_SINGLE_COLLEGES', True):
+            selections += [dict(default, colleges=[college]) for college in colleges]
+        for selection in self.server.config.get('WARMUP_SELECTIONS', []):
+            selections.append(dict(default, **selection))
+        return selections
+
+    def warm_up_caches(self):
+        selections = self.get_warmup_selections()
+        views = self.get_filter_views()
+        start = time.perf_counter()
+        print(f"Cache warm-up: precomputing {len(selections)} selections x {len(views)} views")
+
+        for index, selection in enumerate(selections, start=1):
+            for view in views:
+                try:
+                    self.cached(view)(selection['colleges'], selection['status'], selection['years'])
+                except Exception as error:
+                    print(f"Cache warm-up: {view.__name__} failed for selection {index}: {error}")
+            print(f"Cache warm-up: {index}/{len(selections)} selections done ({time.perf_counter() - start:.2f}s)")
+
+        self.warmup_seconds = time.perf_counter() - start
+        print(f"Cache warm-up finished in {self.warmup_seconds:.2f}s")
+
+    def start_warmup(self):
+        """Run the warm-up in a daemon thread so the server can accept requests immediately."""
+        self.warmup_thread = threading.Thread(target=self.warm_up_caches, name='dash-cache-warmup', daemon=True)
+        self.warmup_thread.start()
+        return self.warmup_thread
+
     def run(self, debug=False):
         self.app.run_server(debug=debug)
 